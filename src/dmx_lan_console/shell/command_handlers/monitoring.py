@@ -714,7 +714,6 @@ class MonitoringCommandHandler(CommandHandler):
                 # Use force_terminal=True like help command for proper color rendering
                 from io import StringIO
                 from rich.console import Console
-                from prompt_toolkit.document import Document
                 import re
 
                 string_io = StringIO()
@@ -742,17 +741,8 @@ class MonitoringCommandHandler(CommandHandler):
                     border_console.print(f"{' ' * padding_needed} [bold cyan]│[/]")
                     right_border = border_buf.getvalue()
 
-                    # Combine and append directly to buffer
-                    full_line = left_border + line + right_border
-                    current_text = self.shell.output_buffer.text
-                    new_text = current_text + full_line
-                    cursor_pos = len(new_text) if self.shell.follow_tail else min(self.shell.output_buffer.cursor_position, len(new_text))
-                    self.shell.output_buffer.set_document(
-                        Document(text=new_text, cursor_position=cursor_pos),
-                        bypass_readonly=True
-                    )
-
-                self.shell.app.invalidate()
+                    # Combine and append directly to output
+                    self.shell._write_output(left_border + line + right_border)
 
                 self.shell._append_output("[bold cyan]│[/]" + " " * INNER_WIDTH + "[bold cyan]│[/]\n")
 
@@ -2,6 +2,7 @@
 
 This module contains controllers for real-time features:
 - ConnectionState: WebSocket connection state enum
+- ShellMode: Which view (and controller) currently owns the shell screen
 - LogTailController: Real-time log streaming via WebSocket
 - WatchController: Periodic refresh of watch targets
 - LogViewController: Paginated log viewing with filtering and search
@@ -37,6 +38,15 @@ class ConnectionState(Enum):
     RECONNECTING = "reconnecting"
 
 
+class ShellMode(Enum):
+    """Shell view modes; exactly one is active at a time."""
+    NORMAL = "normal"
+    LOG_TAIL = "log_tail"
+    WATCH = "watch"
+    LOG_VIEW = "log_view"
+    EVENTS = "events"
+
+
 class LogTailController:
     """
     Controller for real-time log tailing via WebSocket.
@@ -1074,7 +1084,8 @@ class WatchController:
 
                 # Execute the watch command and capture output
                 try:
-                    # Save current output buffer position
+                    # Save current output buffer position (flushing queued output first)
+                    self.shell._flush_output()
                     old_output = self.shell.output_buffer.text
 
                     # Execute command based on target
@@ -1090,6 +1101,7 @@ class WatchController:
                         self.shell.monitoring_handler._monitor_dashboard()
 
                     # Capture new output added to output buffer
+                    self.shell._flush_output()
                     new_output = self.shell.output_buffer.text
                     if len(new_output) > len(old_output):
                         # Extract only the new content
@@ -18,7 +18,7 @@ from collections import deque
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 import httpx
 import websockets
@@ -27,6 +27,7 @@ from prompt_toolkit import Application
 from prompt_toolkit.application import run_in_terminal
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.document import Document, Document as PTDocument
+from prompt_toolkit.filters import Condition
 from prompt_toolkit.formatted_text import ANSI, FormattedText, to_formatted_text
 from prompt_toolkit.history import FileHistory
 from rich import box
@@ -52,6 +53,7 @@ from .ui_components import (
     TOOLBAR_STYLE,
     DEFAULT_CACHE_TTL,
     FIELD_DESCRIPTIONS,
+    OutputBuffer,
 )
 
 from .controllers import (
@@ -59,6 +61,7 @@ from .controllers import (
     EventsController,
     LogTailController,
     LogViewController,
+    ShellMode,
     WatchController,
 )
 
@@ -84,6 +87,12 @@ DEFAULT_API_TIMEOUT = 10.0
 WS_RECV_TIMEOUT = 1.0
 DEFAULT_LOG_LINES = 50
 
+# Output batching: appended text is flushed to the output buffer after a short
+# delay, so bursts of writes reach the screen as a single update
+OUTPUT_FLUSH_DELAY = 0.004
+OUTPUT_FLUSH_DELAY_REPAINT = 0.016  # For chunks that clear or home the screen
+OUTPUT_FLUSH_MAX_DELAY = 0.032
+
 class ArtNetShell:
     """Interactive shell for the DMX LAN Console using prompt_toolkit."""
 
@@ -186,58 +195,50 @@ class ArtNetShell:
         }
 
         # Create output buffer (read-only buffer for displaying command output with ANSI colors)
-        self.output_buffer = Buffer(
-            read_only=True,
-            multiline=True,
-        )
+        self.output_buffer = OutputBuffer()
 
         # Follow-tail mode: auto-scroll to bottom when new output is added
         self.follow_tail = True
 
-        # Create log tail buffer for real-time log streaming
-        self.log_tail_buffer = Buffer(
-            read_only=True,
-            multiline=True,
-        )
+        # Formatted output waiting to be flushed to the output buffer
+        self._pending_output: list[str] = []
+        self._output_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._output_flush_deadline = 0.0
+
+        # Current view mode (normal, log tail, watch, log view or events)
+        self.mode = ShellMode.NORMAL
 
-        # Log tail mode state
-        self.in_log_tail_mode = False
+        # One shared filter per mode for the layout and key bindings
+        self._mode_filters: dict[ShellMode, Condition] = {
+            mode: Condition(lambda mode=mode: self.mode is mode) for mode in ShellMode
+        }
+
+        # Create log tail buffer for real-time log streaming
+        self.log_tail_buffer = OutputBuffer()
 
         # Log tail controller (will be initialized after app is created)
         self.log_tail_controller: Optional[LogTailController] = None
 
         # Create watch buffer for periodic watch updates
-        self.watch_buffer = Buffer(
-            read_only=True,
-            multiline=True,
-        )
-
-        # Watch mode state
-        self.in_watch_mode = False
+        self.watch_buffer = OutputBuffer()
 
         # Watch controller (will be initialized after app is created)
         self.watch_controller: Optional[WatchController] = None
 
         # Create log view buffer for paginated log viewing
-        self.log_view_buffer = Buffer(
-            read_only=True,
-            multiline=True,
-        )
-
-        # Log view mode state
-        self.in_log_view_mode = False
+        self.log_view_buffer = OutputBuffer()
 
         # Log view controller (will be initialized after app is created)
         self.log_view_controller: Optional[LogViewController] = None
 
-        # Create events buffer for real-time event streaming
-        self.events_buffer = Buffer(
-            read_only=True,
-            multiline=True,
-        )
+        # Controller bound while in log view mode, read by the key handlers
+        self._active_controller: Optional[LogViewController] = None
 
-        # Events mode state
-        self.in_events_mode = False
+        # Pending log view refresh (coalesces refreshes requested by held keys)
+        self._pending_refresh: Optional[asyncio.Task] = None
+
+        # Create events buffer for real-time event streaming
+        self.events_buffer = OutputBuffer()
 
         # Events controller (will be initialized after app is created)
         self.events_controller: Optional[EventsController] = None
@@ -245,6 +246,9 @@ class ArtNetShell:
         # Command execution state flag (to prevent event notifications during command execution)
         self.is_executing_command = False
 
+        # Mode exit in progress flag (so repeated Esc/q presses exit only once)
+        self._exiting_mode = False
+
         # Set up multi-level autocomplete with command structure
         completer = TrailingSpaceCompleter(get_completer_dict())
 
@@ -294,6 +298,11 @@ class ArtNetShell:
             shell=self,
         )
 
+        # PageUp/PageDown scroll step in characters, cached so held keys don't
+        # query the terminal size; refreshed after each render (incl. resizes)
+        self._cached_scroll_step = (self.app.output.get_size().rows - 4) * 80
+        self.app.after_render += self._update_scroll_step
+
         # Set up terminal resize handler for pagination (prompt_toolkit handles layout resize)
         if hasattr(signal, 'SIGWINCH'):
             signal.signal(signal.SIGWINCH, self._handle_terminal_resize)
@@ -307,6 +316,38 @@ class ArtNetShell:
 
         self._connect()
 
+    def mode_filter(self, mode: ShellMode) -> Condition:
+        """
+        Get the shared filter that is true while the shell is in the given mode.
+
+        Args:
+            mode: Shell mode to test for
+
+        Returns:
+            Condition instance shared by every caller
+        """
+        return self._mode_filters[mode]
+
+    @property
+    def in_log_tail_mode(self) -> bool:
+        """Check if the shell is in log tail mode."""
+        return self.mode is ShellMode.LOG_TAIL
+
+    @property
+    def in_watch_mode(self) -> bool:
+        """Check if the shell is in watch mode."""
+        return self.mode is ShellMode.WATCH
+
+    @property
+    def in_log_view_mode(self) -> bool:
+        """Check if the shell is in log view mode."""
+        return self.mode is ShellMode.LOG_VIEW
+
+    @property
+    def in_events_mode(self) -> bool:
+        """Check if the shell is in events mode."""
+        return self.mode is ShellMode.EVENTS
+
     def _save_json(self, file_path: Path, data: Any) -> None:
         """
         Save JSON data to file.
@@ -428,9 +469,58 @@ class ArtNetShell:
         )
         temp_console.print(text, end="")
 
+        self._write_output(buffer.getvalue())
+
+    def _write_output(self, formatted_text: str) -> None:
+        """
+        Queue already ANSI-formatted text for the output buffer.
+
+        Writes are batched: the queue is flushed after OUTPUT_FLUSH_DELAY
+        (OUTPUT_FLUSH_DELAY_REPAINT if the text clears or homes the screen),
+        never later than OUTPUT_FLUSH_MAX_DELAY after the first queued write.
+        Before the application is running, text is written immediately.
+
+        Args:
+            formatted_text: ANSI-formatted text to append
+        """
+        self._pending_output.append(formatted_text)
+
+        if not self.app.is_running or self.app.loop is None:
+            self._flush_output()
+            return
+
+        loop = self.app.loop
+        now = loop.time()
+        if self._output_flush_handle is None:
+            self._output_flush_deadline = now + OUTPUT_FLUSH_MAX_DELAY
+
+        if "\x1b[2J" in formatted_text or "\x1b[H" in formatted_text:
+            delay = OUTPUT_FLUSH_DELAY_REPAINT
+        else:
+            delay = OUTPUT_FLUSH_DELAY
+        when = min(now + delay, self._output_flush_deadline)
+
+        # Keep an already scheduled flush unless this chunk needs a later one
+        if self._output_flush_handle is not None:
+            if self._output_flush_handle.when() >= when:
+                return
+            self._output_flush_handle.cancel()
+        self._output_flush_handle = loop.call_at(when, self._flush_output)
+
+    def _flush_output(self) -> None:
+        """Append all queued output to the output buffer in one update."""
+        if self._output_flush_handle is not None:
+            self._output_flush_handle.cancel()
+            self._output_flush_handle = None
+
+        if not self._pending_output:
+            return
+
+        formatted_text = "".join(self._pending_output)
+        self._pending_output.clear()
+
         # Get current content and append new text
         current_text = self.output_buffer.text
-        formatted_text = buffer.getvalue()
         new_text = current_text + formatted_text
 
         # Update buffer document
@@ -453,6 +543,14 @@ class ArtNetShell:
         # Trigger redraw
         self.app.invalidate()
 
+    def _clear_output(self) -> None:
+        """Clear the output buffer, discarding any output not yet flushed."""
+        if self._output_flush_handle is not None:
+            self._output_flush_handle.cancel()
+            self._output_flush_handle = None
+        self._pending_output.clear()
+        self.output_buffer.clear()
+
     async def _enter_log_tail_mode(self, level: Optional[str] = None, logger: Optional[str] = None) -> None:
         """
         Enter log tail mode and start streaming logs.
@@ -483,7 +581,7 @@ class ArtNetShell:
         )
 
         # Switch to log tail mode
-        self.in_log_tail_mode = True
+        self.mode = ShellMode.LOG_TAIL
         self.app.invalidate()
 
         # Start log tail controller
@@ -498,7 +596,7 @@ class ArtNetShell:
         await self.log_tail_controller.stop()
 
         # Switch back to normal mode
-        self.in_log_tail_mode = False
+        self.mode = ShellMode.NORMAL
         self.app.invalidate()
 
         # Show exit message in normal output
@@ -531,7 +629,7 @@ class ArtNetShell:
         )
 
         # Switch to watch mode
-        self.in_watch_mode = True
+        self.mode = ShellMode.WATCH
         self.app.invalidate()
 
         # Start watch controller
@@ -546,7 +644,7 @@ class ArtNetShell:
         await self.watch_controller.stop()
 
         # Switch back to normal mode
-        self.in_watch_mode = False
+        self.mode = ShellMode.NORMAL
         self.app.invalidate()
 
         # Show exit message in normal output
@@ -575,7 +673,8 @@ class ArtNetShell:
         self.log_view_buffer.set_document(Document(""), bypass_readonly=True)
 
         # Switch to log view mode
-        self.in_log_view_mode = True
+        self._active_controller = self.log_view_controller
+        self.mode = ShellMode.LOG_VIEW
         self.app.invalidate()
 
         # Start log view controller
@@ -595,7 +694,8 @@ class ArtNetShell:
         await self.log_view_controller.stop()
 
         # Switch back to normal mode
-        self.in_log_view_mode = False
+        self._active_controller = None
+        self.mode = ShellMode.NORMAL
         self.app.invalidate()
 
         # Show exit message in normal output
@@ -629,7 +729,7 @@ class ArtNetShell:
         )
 
         # Switch to events mode
-        self.in_events_mode = True
+        self.mode = ShellMode.EVENTS
         self.app.invalidate()
 
         # Events controller is already running in background, just ensure follow-tail is enabled
@@ -642,12 +742,46 @@ class ArtNetShell:
             return
 
         # Switch back to normal mode
-        self.in_events_mode = False
+        self.mode = ShellMode.NORMAL
         self.app.invalidate()
 
         # Show exit message in normal output
         self._append_output("\n[dim]Exited events mode[/]\n")
 
+    def _schedule_mode_exit(self, exit_mode: Callable[[], Awaitable[None]]) -> None:
+        """
+        Schedule a mode exit unless one is already in progress.
+
+        Args:
+            exit_mode: One of the _exit_*_mode coroutine methods
+        """
+        if self._exiting_mode:
+            return
+
+        self._exiting_mode = True
+        self.app.create_background_task(self._run_mode_exit(exit_mode))
+
+    async def _run_mode_exit(self, exit_mode: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run a mode exit coroutine and clear the in-progress flag afterwards.
+
+        Args:
+            exit_mode: One of the _exit_*_mode coroutine methods
+        """
+        try:
+            await exit_mode()
+        finally:
+            self._exiting_mode = False
+
+    def _schedule_refresh(self) -> None:
+        """Schedule a log view refresh, reusing one that has not run yet."""
+        # A refresh that is still pending reads the controller state when it
+        # runs, so it already covers any page/filter change made since
+        if self._pending_refresh and not self._pending_refresh.done():
+            return
+
+        self._pending_refresh = self.app.create_background_task(self.log_view_controller.refresh())
+
     def _accept_input(self, buffer: Buffer) -> bool:
         """
         Handle command input when user presses Enter.
@@ -726,6 +860,18 @@ class ArtNetShell:
                 page_size=new_page_size,
             )
 
+    def _update_scroll_step(self, app: Application) -> None:
+        """
+        Refresh the cached output scroll step after a render.
+
+        Args:
+            app: Application that was just rendered
+        """
+        render_info = self.normal_output_window.render_info
+        if render_info is not None:
+            # Approximate line length of 80 characters per visible row
+            self._cached_scroll_step = render_info.window_height * 80
+
     def _get_bottom_toolbar(self) -> list[tuple[str, str]]:
         """Get toolbar fragments from toolbar manager."""
         return self.toolbar_manager.get_toolbar_fragments()
@@ -1198,17 +1344,9 @@ class ArtNetShell:
 
         # Append to output buffer (already ANSI-formatted)
         output = buffer.getvalue()
-        current_text = self.output_buffer.text
-        new_text = current_text + output
         if not output.endswith('\n'):
-            new_text += '\n'
-        # Respect follow-tail mode
-        cursor_pos = len(new_text) if self.follow_tail else min(self.output_buffer.cursor_position, len(new_text))
-        self.output_buffer.set_document(
-            Document(text=new_text, cursor_position=cursor_pos),
-            bypass_readonly=True
-        )
-        self.app.invalidate()
+            output += '\n'
+        self._write_output(output)
 
     def do_tips(self, arg: str) -> None:
         """Show helpful tips for using the shell."""
@@ -1239,21 +1377,13 @@ class ArtNetShell:
 
         # Append to output buffer (already ANSI-formatted)
         output = buffer.getvalue()
-        current_text = self.output_buffer.text
-        new_text = current_text + output
         if not output.endswith('\n'):
-            new_text += '\n'
-        # Respect follow-tail mode
-        cursor_pos = len(new_text) if self.follow_tail else min(self.output_buffer.cursor_position, len(new_text))
-        self.output_buffer.set_document(
-            Document(text=new_text, cursor_position=cursor_pos),
-            bypass_readonly=True
-        )
-        self.app.invalidate()
+            output += '\n'
+        self._write_output(output)
 
     def do_clear(self, arg: str) -> None:
         """Clear the screen."""
-        self.output_buffer.set_document(Document(""), bypass_readonly=True)
+        self._clear_output()
         self.app.invalidate()
 
     def do_exit(self, arg: str) -> bool:
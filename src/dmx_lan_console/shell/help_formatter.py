@@ -9,7 +9,6 @@ from __future__ import annotations
 from io import StringIO
 from typing import TYPE_CHECKING
 
-from prompt_toolkit.document import Document
 from rich import box
 from rich.console import Console
 from rich.table import Table
@@ -113,18 +112,10 @@ class HelpFormatter:
             if docstring:
                 # Format with colors and styling (returns ANSI-formatted text)
                 help_text = self.format_command_help(main_command, docstring)
-                # Append directly to buffer (already ANSI-formatted)
-                current_text = self.shell.output_buffer.text
-                new_text = current_text + help_text
+                # Append directly to output (already ANSI-formatted)
                 if not help_text.endswith('\n'):
-                    new_text += '\n'
-                # Respect follow-tail mode
-                cursor_pos = len(new_text) if self.shell.follow_tail else min(self.shell.output_buffer.cursor_position, len(new_text))
-                self.shell.output_buffer.set_document(
-                    Document(text=new_text, cursor_position=cursor_pos),
-                    bypass_readonly=True
-                )
-                self.shell.app.invalidate()
+                    help_text += '\n'
+                self.shell._write_output(help_text)
             else:
                 # Rich markup, use _append_output
                 self.shell._append_output(f"\n[yellow]No help available for command '{main_command}'[/]\n")
@@ -245,17 +236,9 @@ class HelpFormatter:
 
         # Append to output buffer (already ANSI-formatted)
         output = buffer.getvalue()
-        current_text = self.shell.output_buffer.text
-        new_text = current_text + output
         if not output.endswith('\n'):
-            new_text += '\n'
-        # Respect follow-tail mode
-        cursor_pos = len(new_text) if self.shell.follow_tail else min(self.shell.output_buffer.cursor_position, len(new_text))
-        self.shell.output_buffer.set_document(
-            Document(text=new_text, cursor_position=cursor_pos),
-            bypass_readonly=True
-        )
-        self.shell.app.invalidate()
+            output += '\n'
+        self.shell._write_output(output)
 
     def _show_mappings_create_help(self) -> None:
         """Show detailed help for the 'mappings create' command."""
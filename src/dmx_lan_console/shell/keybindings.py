@@ -6,17 +6,54 @@ interactive shell interface.
 
 from __future__ import annotations
 
-import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from prompt_toolkit.document import Document
 from prompt_toolkit.filters import Condition
-from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.key_binding import (
+    ConditionalKeyBindings,
+    KeyBindings,
+    KeyBindingsBase,
+    KeyPressEvent,
+    merge_key_bindings,
+)
+from prompt_toolkit.keys import Keys
+
+from .controllers import ShellMode
 
 if TYPE_CHECKING:
+    from .controllers import LogViewController
     from .core import ArtNetShell
 
 
+# Log view mode keys: key -> (LogViewController action, refetch).
+# Special keys are Keys members and only match the Keys member itself.
+# Refetch actions refresh the page from the server; the rest only redraw.
+LOG_VIEW_DISPATCH: dict[Keys | str, tuple[Optional[Callable[[LogViewController], Any]], bool]] = {
+    Keys.PageUp: (lambda c: c.navigate_page("prev"), True),      # Previous page
+    Keys.PageDown: (lambda c: c.navigate_page("next"), True),    # Next page
+    Keys.Home: (lambda c: c.navigate_page("first"), True),       # First page
+    Keys.End: (lambda c: c.navigate_page("last"), True),         # Last page
+    "l": (lambda c: c.cycle_level_filter(), True),               # Cycle log level filter
+    "c": (lambda c: c.set_logger_filter(None), True),            # Clear logger filter
+    "r": (None, True),                                           # Manual refresh
+    " ": (lambda c: c.toggle_follow_mode(), True),               # Toggle follow mode
+    "f": (lambda c: c.show_filter_modal(), False),               # Logger filter modal
+    "/": (lambda c: c.show_search_modal(), False),               # Search pattern modal
+    "?": (lambda c: c.show_help_modal(), False),                 # Help modal
+}
+
+# Ctrl+T follow-tail status messages
+_FOLLOW_ON = "\n[dim]Follow-tail enabled[/]\n"
+_FOLLOW_OFF = "\n[dim]Follow-tail disabled[/]\n"
+
+# Log tail 'f' placeholder until a filter prompt exists
+_FILTER_PLACEHOLDER_DOC_FRAGMENT = (
+    "\033[33m[Filter UI not yet implemented - "
+    "use 'logs tail --level LEVEL --logger LOGGER' to set filters]\033[0m\n"
+)
+
+
 class KeyBindingManager:
     """Manages key bindings for the shell."""
 
@@ -27,288 +64,269 @@ class KeyBindingManager:
         Args:
             shell: Reference to the ArtNetShell instance
         """
-        self.shell = shell
-
-    def create_key_bindings(self) -> KeyBindings:
+        self._shell = shell
+        self._kb_cache: KeyBindingsBase | None = None
+
+        # Log view modal filters (only evaluated once already in log view mode)
+        self._cond_modal = Condition(lambda: self.shell.log_view_controller.in_modal)
+        self._cond_search_modal = self._cond_modal & Condition(
+            lambda: self.shell.log_view_controller.modal_type == "search"
+        )
+        self._cond_input_modal = self._cond_modal & Condition(
+            lambda: self.shell.log_view_controller.modal_type in ("filter", "search")
+        )
+
+    @property
+    def shell(self) -> ArtNetShell:
+        """The shell these key bindings act on."""
+        return self._shell
+
+    @shell.setter
+    def shell(self, shell: ArtNetShell) -> None:
+        self._shell = shell
+        # Rebuild the bindings against the new shell on next request
+        self._kb_cache = None
+
+    def create_key_bindings(self) -> KeyBindingsBase:
         """
         Create and configure all key bindings for the shell.
 
+        Bindings for each mode live in their own registry, wrapped in a
+        ConditionalKeyBindings for that mode, and are merged with the basic
+        shell bindings. The result is built once and cached; later calls
+        return the same instance until the shell is replaced.
+
         Returns:
-            Configured KeyBindings instance
+            Configured key bindings
         """
-        kb = KeyBindings()
-
-        # Basic shell keybindings
-        @kb.add('c-c')
-        def _(event):
-            """Handle Ctrl+C - clear input or show message."""
-            if self.shell.input_buffer.text:
-                self.shell.input_buffer.reset()
-            else:
-                self.shell._append_output("\n[yellow]Use 'exit' or Ctrl+D to quit.[/]\n")
-
-        @kb.add('c-d')
-        def _(event):
-            """Handle Ctrl+D - exit shell."""
-            event.app.exit(result=True)
+        if self._kb_cache is not None:
+            return self._kb_cache
 
-        @kb.add('c-l')
-        def _(event):
-            """Handle Ctrl+L - clear screen."""
-            self.shell.output_buffer.set_document(Document(""), bypass_readonly=True)
-            event.app.invalidate()
+        # Mode filters are shared with the layout (see ArtNetShell.mode_filter)
+        in_mode = self.shell.mode_filter
 
-        @kb.add('c-t')
-        def _(event):
-            """Handle Ctrl+T - toggle follow-tail mode."""
-            self.shell.follow_tail = not self.shell.follow_tail
-            status = "enabled" if self.shell.follow_tail else "disabled"
-            self.shell._append_output(f"\n[dim]Follow-tail {status}[/]\n")
-
-        @kb.add('pageup')
-        def _(event):
-            """Handle Page Up - scroll output and disable follow-tail."""
-            # Disable follow-tail when manually scrolling
-            self.shell.follow_tail = False
-            # Scroll output buffer up by one page
-            rows = event.app.output.get_size().rows - 4  # Account for input and toolbar
-            new_pos = max(0, self.shell.output_buffer.cursor_position - rows * 80)  # Approximate line length
-            self.shell.output_buffer.cursor_position = new_pos
-            event.app.invalidate()
-
-        @kb.add('pagedown')
-        def _(event):
-            """Handle Page Down - scroll output down."""
-            # Scroll output buffer down by one page
-            rows = event.app.output.get_size().rows - 4  # Account for input and toolbar
-            new_pos = min(len(self.shell.output_buffer.text), self.shell.output_buffer.cursor_position + rows * 80)
-            self.shell.output_buffer.cursor_position = new_pos
-            # If we're at the bottom, re-enable follow-tail
-            if self.shell.output_buffer.cursor_position >= len(self.shell.output_buffer.text) - 10:
-                self.shell.follow_tail = True
-            event.app.invalidate()
+        # Basic shell keybindings
+        kb_base = KeyBindings()
+        kb_base.add('c-c')(self._on_ctrl_c)
+        kb_base.add('c-d')(self._on_ctrl_d)
+        kb_base.add('c-l')(self._on_ctrl_l)
+        kb_base.add('c-t')(self._on_ctrl_t)
+        # (Not in log view mode, where these keys page through the logs instead)
+        kb_base.add('pageup', filter=~in_mode(ShellMode.LOG_VIEW))(self._on_pageup)
+        kb_base.add('pagedown', filter=~in_mode(ShellMode.LOG_VIEW))(self._on_pagedown)
 
         # Log tail mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_tail_mode))
-        def _(event):
-            """Handle Escape in log tail mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_tail_mode())
-
-        @kb.add('q', filter=Condition(lambda: self.shell.in_log_tail_mode))
-        def _(event):
-            """Handle 'q' in log tail mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_tail_mode())
-
-        @kb.add('end', filter=Condition(lambda: self.shell.in_log_tail_mode))
-        def _(event):
-            """Handle End in log tail mode - jump to bottom and enable follow-tail."""
-            if self.shell.log_tail_controller:
-                self.shell.log_tail_controller.enable_follow_tail()
-                event.app.invalidate()
-
-        @kb.add('f', filter=Condition(lambda: self.shell.in_log_tail_mode))
-        def _(event):
-            """Handle 'f' in log tail mode - open filter prompt."""
-            # For now, show a message (we can implement a filter input dialog later)
-            self.shell.log_tail_buffer.insert_text(
-                "\033[33m[Filter UI not yet implemented - use 'logs tail --level LEVEL --logger LOGGER' to set filters]\033[0m\n"
-            )
-            event.app.invalidate()
+        kb_log_tail = KeyBindings()
+        kb_log_tail.add('escape')(self._on_log_tail_exit)
+        kb_log_tail.add('q')(self._on_log_tail_exit)
+        kb_log_tail.add('end')(self._on_log_tail_end)
+        kb_log_tail.add('f')(self._on_log_tail_filter)
 
         # Watch mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_watch_mode))
-        def _(event):
-            """Handle Escape in watch mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_watch_mode())
-
-        @kb.add('q', filter=Condition(lambda: self.shell.in_watch_mode))
-        def _(event):
-            """Handle 'q' in watch mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_watch_mode())
-
-        @kb.add('+', filter=Condition(lambda: self.shell.in_watch_mode))
-        def _(event):
-            """Handle '+' in watch mode - decrease refresh interval (faster)."""
-            if self.shell.watch_controller:
-                new_interval = max(0.5, self.shell.watch_controller.refresh_interval - 0.5)
-                self.shell.watch_controller.set_interval(new_interval)
-                event.app.invalidate()
-
-        @kb.add('-', filter=Condition(lambda: self.shell.in_watch_mode))
-        def _(event):
-            """Handle '-' in watch mode - increase refresh interval (slower)."""
-            if self.shell.watch_controller:
-                new_interval = self.shell.watch_controller.refresh_interval + 0.5
-                self.shell.watch_controller.set_interval(new_interval)
-                event.app.invalidate()
+        kb_watch = KeyBindings()
+        kb_watch.add('escape')(self._on_watch_exit)
+        kb_watch.add('q')(self._on_watch_exit)
+        kb_watch.add('+')(self._on_watch_faster)
+        kb_watch.add('-')(self._on_watch_slower)
 
         # Log view mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_view_mode))
-        def _(event):
-            """Handle Escape in log view mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_view_mode())
-
-        @kb.add('q', filter=Condition(lambda: self.shell.in_log_view_mode))
-        def _(event):
-            """Handle 'q' in log view mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_log_view_mode())
-
-        @kb.add('pageup', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Page Up in log view mode - previous page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("prev")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('pagedown', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Page Down in log view mode - next page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("next")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('home', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Home in log view mode - first page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("first")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('end', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle End in log view mode - last page."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.navigate_page("last")
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('l', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle 'l' in log view mode - cycle log level filter."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.cycle_level_filter()
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('c', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle 'c' in log view mode - clear logger filter."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.set_logger_filter(None)
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('r', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle 'r' in log view mode - manual refresh."""
-            if self.shell.log_view_controller:
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('space', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Space in log view mode - toggle follow mode."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.toggle_follow_mode()
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('f', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle 'f' in log view mode - set logger filter (modal prompt)."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_filter_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
-
-        @kb.add('/', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle '/' in log view mode - edit search pattern (modal prompt)."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_search_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
-
-        @kb.add('?', filter=Condition(lambda: self.shell.in_log_view_mode and not self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle '?' in log view mode - show help modal."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.show_help_modal()
-                asyncio.create_task(self.shell.log_view_controller._render())
+        kb_log_view = KeyBindings()
+        kb_log_view.add('escape')(self._on_log_view_exit)
+        kb_log_view.add('q')(self._on_log_view_exit)
+        kb_log_view.add('<any>', filter=~self._cond_modal)(self._on_log_view_key)
 
         # Modal mode key bindings (when in modal dialog)
-        @kb.add('enter', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Enter in modal - accept input."""
-            if self.shell.log_view_controller:
-                if self.shell.log_view_controller.modal_type == "help":
-                    # Help modal: just close
-                    self.shell.log_view_controller.close_modal(accept=False)
-                else:
-                    # Filter/Search modal: accept input
-                    self.shell.log_view_controller.close_modal(accept=True)
-                asyncio.create_task(self.shell.log_view_controller.refresh())
-
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle Escape in modal - cancel."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.close_modal(accept=False)
-                asyncio.create_task(self.shell.log_view_controller._render())
-
-        @kb.add('c-r', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal and self.shell.log_view_controller.modal_type == "search"))
-        def _(event):
-            """Handle Ctrl+R in search modal - toggle regex mode."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.search_regex = not self.shell.log_view_controller.search_regex
-                asyncio.create_task(self.shell.log_view_controller._render())
-
-        @kb.add('backspace', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal and self.shell.log_view_controller.modal_type in ("filter", "search")))
-        def _(event):
-            """Handle Backspace in modal - delete character."""
-            if self.shell.log_view_controller:
-                self.shell.log_view_controller.modal_backspace()
-                asyncio.create_task(self.shell.log_view_controller._render())
+        kb_log_view.add('enter', filter=self._cond_modal)(self._on_modal_enter)
+        kb_log_view.add('escape', filter=self._cond_modal)(self._on_modal_escape)
+        kb_log_view.add('c-r', filter=self._cond_search_modal)(self._on_modal_toggle_regex)
+        kb_log_view.add('backspace', filter=self._cond_input_modal)(self._on_modal_backspace)
 
         # Catch all printable characters in modal
-        @kb.add('<any>', filter=Condition(lambda: self.shell.in_log_view_mode and self.shell.log_view_controller.in_modal))
-        def _(event):
-            """Handle character input in modal."""
-            if self.shell.log_view_controller:
-                # Close help modal on any key
-                if self.shell.log_view_controller.modal_type == "help":
-                    self.shell.log_view_controller.close_modal(accept=False)
-                    asyncio.create_task(self.shell.log_view_controller._render())
-                # Add character to filter/search input
-                elif self.shell.log_view_controller.modal_type in ("filter", "search"):
-                    if hasattr(event, 'data') and event.data and len(event.data) == 1 and event.data.isprintable():
-                        self.shell.log_view_controller.modal_add_char(event.data)
-                        asyncio.create_task(self.shell.log_view_controller._render())
+        kb_log_view.add('<any>', filter=self._cond_modal)(self._on_modal_char)
 
         # Events mode keybindings
-        @kb.add('escape', filter=Condition(lambda: self.shell.in_events_mode))
-        def _(event):
-            """Handle Escape in events mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_events_mode())
-
-        @kb.add('q', filter=Condition(lambda: self.shell.in_events_mode))
-        def _(event):
-            """Handle 'q' in events mode - exit to normal view."""
-            asyncio.create_task(self.shell._exit_events_mode())
-
-        @kb.add('end', filter=Condition(lambda: self.shell.in_events_mode))
-        def _(event):
-            """Handle End in events mode - jump to bottom and enable follow-tail."""
-            if self.shell.events_controller:
-                self.shell.events_controller.enable_follow_tail()
-                event.app.invalidate()
-
-        @kb.add('f', filter=Condition(lambda: self.shell.in_events_mode))
-        def _(event):
-            """Handle 'f' in events mode - show filter info."""
-            # For now, show current filter status as a message in the buffer
-            if self.shell.events_controller:
-                current_filter = self.shell.events_controller.event_type_filter or "None"
-                filter_msg = f"\033[33m[Current filter: {current_filter} | Use 'logs events --type device|mapping|health' to set filters]\033[0m\n"
-                # Append to events buffer
-                current_text = self.shell.events_buffer.text
-                self.shell.events_buffer.set_document(
-                    Document(text=current_text + filter_msg, cursor_position=len(current_text + filter_msg)),
-                    bypass_readonly=True
-                )
-                event.app.invalidate()
-
-        return kb
+        kb_events = KeyBindings()
+        kb_events.add('escape')(self._on_events_exit)
+        kb_events.add('q')(self._on_events_exit)
+        kb_events.add('end')(self._on_events_end)
+        kb_events.add('f')(self._on_events_filter)
+
+        self._kb_cache = merge_key_bindings([
+            kb_base,
+            ConditionalKeyBindings(kb_log_tail, in_mode(ShellMode.LOG_TAIL)),
+            ConditionalKeyBindings(kb_watch, in_mode(ShellMode.WATCH)),
+            ConditionalKeyBindings(kb_log_view, in_mode(ShellMode.LOG_VIEW)),
+            ConditionalKeyBindings(kb_events, in_mode(ShellMode.EVENTS)),
+        ])
+        return self._kb_cache
+
+    def _on_ctrl_c(self, event: KeyPressEvent) -> None:
+        """Handle Ctrl+C - clear input or show message."""
+        if self.shell.input_buffer.text:
+            self.shell.input_buffer.reset()
+        else:
+            self.shell._append_output("\n[yellow]Use 'exit' or Ctrl+D to quit.[/]\n")
+
+    def _on_ctrl_d(self, event: KeyPressEvent) -> None:
+        """Handle Ctrl+D - exit shell."""
+        event.app.exit(result=True)
+
+    def _on_ctrl_l(self, event: KeyPressEvent) -> None:
+        """Handle Ctrl+L - clear screen."""
+        self.shell._clear_output()
+        # Let the diffing renderer repaint old -> new in one write; erasing
+        # the screen first would flash a blank frame
+        event.app.invalidate()
+
+    def _on_ctrl_t(self, event: KeyPressEvent) -> None:
+        """Handle Ctrl+T - toggle follow-tail mode."""
+        self.shell.follow_tail = not self.shell.follow_tail
+        self.shell._append_output(_FOLLOW_ON if self.shell.follow_tail else _FOLLOW_OFF)
+
+    def _on_pageup(self, event: KeyPressEvent) -> None:
+        """Handle Page Up - scroll output and disable follow-tail."""
+        # Disable follow-tail when manually scrolling
+        self.shell.follow_tail = False
+        # Scroll output buffer up by one page
+        new_pos = max(0, self.shell.output_buffer.cursor_position - self.shell._cached_scroll_step)
+        # Moving the cursor already schedules a (coalesced) redraw
+        self.shell.output_buffer.cursor_position = new_pos
+
+    def _on_pagedown(self, event: KeyPressEvent) -> None:
+        """Handle Page Down - scroll output down."""
+        buf = self.shell.output_buffer
+        # Buffer.text is the current working line, so len() on it is O(1)
+        text_len = len(buf.text)
+        # Scroll output buffer down by one page
+        new_pos = min(text_len, buf.cursor_position + self.shell._cached_scroll_step)
+        # Moving the cursor already schedules a (coalesced) redraw
+        buf.cursor_position = new_pos
+        # If we're at the bottom, re-enable follow-tail
+        if new_pos >= text_len - 10:
+            self.shell.follow_tail = True
+
+    def _on_log_tail_exit(self, event: KeyPressEvent) -> None:
+        """Handle Escape or 'q' in log tail mode - exit to normal view."""
+        self.shell._schedule_mode_exit(self.shell._exit_log_tail_mode)
+
+    def _on_log_tail_end(self, event: KeyPressEvent) -> None:
+        """Handle End in log tail mode - jump to bottom and enable follow-tail."""
+        if self.shell.log_tail_controller:
+            self.shell.log_tail_controller.enable_follow_tail()
+            event.app.invalidate()
+
+    def _on_log_tail_filter(self, event: KeyPressEvent) -> None:
+        """Handle 'f' in log tail mode - open filter prompt."""
+        # For now, show a message (we can implement a filter input dialog later)
+        buf = self.shell.log_tail_buffer
+        text = buf.text + _FILTER_PLACEHOLDER_DOC_FRAGMENT
+        buf.set_document(Document(text=text, cursor_position=len(text)), bypass_readonly=True)
+
+    def _on_watch_exit(self, event: KeyPressEvent) -> None:
+        """Handle Escape or 'q' in watch mode - exit to normal view."""
+        self.shell._schedule_mode_exit(self.shell._exit_watch_mode)
+
+    def _on_watch_faster(self, event: KeyPressEvent) -> None:
+        """Handle '+' in watch mode - decrease refresh interval (faster)."""
+        if self.shell.watch_controller:
+            new_interval = max(0.5, self.shell.watch_controller.refresh_interval - 0.5)
+            self.shell.watch_controller.set_interval(new_interval)
+            event.app.invalidate()
+
+    def _on_watch_slower(self, event: KeyPressEvent) -> None:
+        """Handle '-' in watch mode - increase refresh interval (slower)."""
+        if self.shell.watch_controller:
+            new_interval = self.shell.watch_controller.refresh_interval + 0.5
+            self.shell.watch_controller.set_interval(new_interval)
+            event.app.invalidate()
+
+    def _on_log_view_exit(self, event: KeyPressEvent) -> None:
+        """Handle Escape or 'q' in log view mode - exit to normal view."""
+        self.shell._schedule_mode_exit(self.shell._exit_log_view_mode)
+
+    def _on_log_view_key(self, event: KeyPressEvent) -> None:
+        """Handle a key in log view mode by looking it up in LOG_VIEW_DISPATCH."""
+        action = LOG_VIEW_DISPATCH.get(event.key_sequence[-1].key)
+        ctrl = self.shell._active_controller
+        if action is None or ctrl is None:
+            return
+
+        apply, refetch = action
+        if apply is not None:
+            apply(ctrl)
+
+        if refetch:
+            self.shell._schedule_refresh()
+        else:
+            event.app.create_background_task(ctrl._render())
+
+    def _on_modal_enter(self, event: KeyPressEvent) -> None:
+        """Handle Enter in modal - accept input."""
+        ctrl = self.shell._active_controller
+        if ctrl is not None:
+            if ctrl.modal_type == "help":
+                # Help modal: just close
+                ctrl.close_modal(accept=False)
+            else:
+                # Filter/Search modal: accept input
+                ctrl.close_modal(accept=True)
+            self.shell._schedule_refresh()
+
+    def _on_modal_escape(self, event: KeyPressEvent) -> None:
+        """Handle Escape in modal - cancel."""
+        ctrl = self.shell._active_controller
+        if ctrl is not None:
+            ctrl.close_modal(accept=False)
+            event.app.create_background_task(ctrl._render())
+
+    def _on_modal_toggle_regex(self, event: KeyPressEvent) -> None:
+        """Handle Ctrl+R in search modal - toggle regex mode."""
+        ctrl = self.shell._active_controller
+        if ctrl is not None:
+            ctrl.search_regex = not ctrl.search_regex
+            event.app.create_background_task(ctrl._render())
+
+    def _on_modal_backspace(self, event: KeyPressEvent) -> None:
+        """Handle Backspace in modal - delete character."""
+        ctrl = self.shell._active_controller
+        if ctrl is not None:
+            ctrl.modal_backspace()
+            event.app.create_background_task(ctrl._render())
+
+    def _on_modal_char(self, event: KeyPressEvent) -> None:
+        """Handle character input in modal."""
+        ctrl = self.shell._active_controller
+        if ctrl is not None:
+            # Close help modal on any key
+            if ctrl.modal_type == "help":
+                ctrl.close_modal(accept=False)
+                event.app.create_background_task(ctrl._render())
+            # Add character to filter/search input
+            elif ctrl.modal_type in ("filter", "search"):
+                if hasattr(event, 'data') and event.data and len(event.data) == 1 and event.data.isprintable():
+                    ctrl.modal_add_char(event.data)
+                    event.app.create_background_task(ctrl._render())
+
+    def _on_events_exit(self, event: KeyPressEvent) -> None:
+        """Handle Escape or 'q' in events mode - exit to normal view."""
+        self.shell._schedule_mode_exit(self.shell._exit_events_mode)
+
+    def _on_events_end(self, event: KeyPressEvent) -> None:
+        """Handle End in events mode - jump to bottom and enable follow-tail."""
+        if self.shell.events_controller:
+            self.shell.events_controller.enable_follow_tail()
+            event.app.invalidate()
+
+    def _on_events_filter(self, event: KeyPressEvent) -> None:
+        """Handle 'f' in events mode - show filter info."""
+        # For now, show current filter status as a message in the buffer
+        if self.shell.events_controller:
+            current_filter = self.shell.events_controller.event_type_filter or "None"
+            filter_msg = f"\033[33m[Current filter: {current_filter} | Use 'logs events --type device|mapping|health' to set filters]\033[0m\n"
+            # Append to events buffer
+            current_text = self.shell.events_buffer.text
+            self.shell.events_buffer.set_document(
+                Document(text=current_text + filter_msg, cursor_position=len(current_text + filter_msg)),
+                bypass_readonly=True
+            )
+            event.app.invalidate()
@@ -9,16 +9,20 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from prompt_toolkit import Application
-from prompt_toolkit.filters import Condition
-from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.key_binding import KeyBindingsBase
 from prompt_toolkit.layout import ConditionalContainer, FormattedTextControl, HSplit, Layout, Window
 from prompt_toolkit.layout.controls import BufferControl
 
+from .controllers import ShellMode
 from .ui_components import ANSILexer, TOOLBAR_STYLE
 
 if TYPE_CHECKING:
     from .core import ArtNetShell
 
+# Minimum seconds between redraws, so bursts of invalidations (e.g. held
+# PageUp/PageDown autorepeat) collapse into one frame per ~60 Hz tick
+MIN_REDRAW_INTERVAL = 0.016
+
 
 class LayoutBuilder:
     """Builds the prompt_toolkit UI layout for the shell."""
@@ -32,7 +36,7 @@ class LayoutBuilder:
         """
         self.shell = shell
 
-    def build_layout_and_app(self, key_bindings: KeyBindings) -> Application:
+    def build_layout_and_app(self, key_bindings: KeyBindingsBase) -> Application:
         """
         Build the complete UI layout and application.
 
@@ -98,23 +102,23 @@ class LayoutBuilder:
             # Conditionally show normal output, log tail, watch, log view, or events based on mode
             ConditionalContainer(
                 content=self.shell.normal_output_window,
-                filter=Condition(lambda: not self.shell.in_log_tail_mode and not self.shell.in_watch_mode and not self.shell.in_log_view_mode and not self.shell.in_events_mode),
+                filter=self.shell.mode_filter(ShellMode.NORMAL),
             ),
             ConditionalContainer(
                 content=self.shell.log_tail_window,
-                filter=Condition(lambda: self.shell.in_log_tail_mode),
+                filter=self.shell.mode_filter(ShellMode.LOG_TAIL),
             ),
             ConditionalContainer(
                 content=self.shell.watch_window,
-                filter=Condition(lambda: self.shell.in_watch_mode),
+                filter=self.shell.mode_filter(ShellMode.WATCH),
             ),
             ConditionalContainer(
                 content=self.shell.log_view_window,
-                filter=Condition(lambda: self.shell.in_log_view_mode),
+                filter=self.shell.mode_filter(ShellMode.LOG_VIEW),
             ),
             ConditionalContainer(
                 content=self.shell.events_window,
-                filter=Condition(lambda: self.shell.in_events_mode),
+                filter=self.shell.mode_filter(ShellMode.EVENTS),
             ),
             Window(height=1, char='─'),
             # Hide input in log tail, watch, log view, or events mode; show in normal mode
@@ -127,7 +131,7 @@ class LayoutBuilder:
                     height=1,
                     get_line_prefix=lambda line_number, wrap_count: f"{self.shell.prompt}",
                 ),
-                filter=Condition(lambda: not self.shell.in_log_tail_mode and not self.shell.in_watch_mode and not self.shell.in_log_view_mode and not self.shell.in_events_mode),
+                filter=self.shell.mode_filter(ShellMode.NORMAL),
             ),
             # Show log tail prompt in log tail mode
             ConditionalContainer(
@@ -137,7 +141,7 @@ class LayoutBuilder:
                         text=lambda: "[Log Tail Mode - Press Esc/q to exit, End to jump to bottom, f for filters]"
                     ),
                 ),
-                filter=Condition(lambda: self.shell.in_log_tail_mode),
+                filter=self.shell.mode_filter(ShellMode.LOG_TAIL),
             ),
             # Show watch prompt in watch mode
             ConditionalContainer(
@@ -147,7 +151,7 @@ class LayoutBuilder:
                         text=lambda: f"[Watch Mode - {self.shell.watch_controller.watch_target if self.shell.watch_controller and self.shell.watch_controller.watch_target else 'N/A'} - Press Esc/q to exit, +/- to adjust interval]"
                     ),
                 ),
-                filter=Condition(lambda: self.shell.in_watch_mode),
+                filter=self.shell.mode_filter(ShellMode.WATCH),
             ),
             # Show log view prompt in log view mode
             ConditionalContainer(
@@ -157,7 +161,7 @@ class LayoutBuilder:
                         text=lambda: "[Logs View - PgUp/PgDn: navigate | l: level | f: filter | Space: follow | ?: help | q/Esc: exit]"
                     ),
                 ),
-                filter=Condition(lambda: self.shell.in_log_view_mode),
+                filter=self.shell.mode_filter(ShellMode.LOG_VIEW),
             ),
             # Show events prompt in events mode
             ConditionalContainer(
@@ -167,7 +171,7 @@ class LayoutBuilder:
                         text=lambda: "[Events Stream - Real-time event notifications | End: jump to bottom | f: filter by type | q/Esc: exit]"
                     ),
                 ),
-                filter=Condition(lambda: self.shell.in_events_mode),
+                filter=self.shell.mode_filter(ShellMode.EVENTS),
             ),
             Window(height=1, char='─'),
             Window(
@@ -186,4 +190,5 @@ class LayoutBuilder:
             style=TOOLBAR_STYLE,
             full_screen=True,
             mouse_support=True,
+            min_redraw_interval=MIN_REDRAW_INTERVAL,
         )
@@ -4,6 +4,7 @@ This module contains UI-related classes for the interactive shell:
 - TrailingSpaceCompleter: Custom autocomplete with trailing spaces
 - ResponseCache: API response caching with TTL
 - ANSILexer: Terminal color code handling
+- OutputBuffer: Read-only output buffer with a cheap clear
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ from __future__ import annotations
 import time
 from typing import Any, Optional
 
+from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import Completion, Completer, NestedCompleter
 from prompt_toolkit.document import Document, Document as PTDocument
 from prompt_toolkit.formatted_text import ANSI, to_formatted_text
@@ -217,3 +219,39 @@ class ANSILexer(Lexer):
             return []
 
         return get_line
+
+
+class OutputBuffer(Buffer):
+    """
+    Read-only, multiline buffer for displaying output.
+
+    Clearing resets the buffer state in place and fires a single
+    text-changed event, instead of setting and diffing a new document.
+    """
+
+    def __init__(self, **kwargs: Any):
+        """
+        Initialize the output buffer.
+
+        Args:
+            **kwargs: Extra arguments passed to Buffer
+        """
+        super().__init__(read_only=True, multiline=True, **kwargs)
+
+    def set_document(self, value: Document, bypass_readonly: bool = False) -> None:
+        """
+        Set the document, taking the clear() fast path for empty text.
+
+        Args:
+            value: New document
+            bypass_readonly: Allow editing even though the buffer is read-only
+        """
+        if bypass_readonly and not value.text:
+            self.clear()
+            return
+        super().set_document(value, bypass_readonly=bypass_readonly)
+
+    def clear(self) -> None:
+        """Empty the buffer and notify listeners (e.g. the UI) once."""
+        self.reset()
+        self.on_text_changed.fire()
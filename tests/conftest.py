@@ -2,57 +2,47 @@
 
 import multiprocessing
 import socket
-import time
-from contextlib import closing
 
 import pytest
 import httpx
 
 
-def find_free_port():
-    """Find a free port on localhost."""
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("127.0.0.1", 0))
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
+def bind_free_socket():
+    """Bind a listening socket to a free port on localhost and return it."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    return sock
 
 
-def run_mock_server(port):
-    """Run the mock server in a separate process."""
+def run_mock_server(sock):
+    """Run the mock server in a separate process on an already-bound socket."""
     import uvicorn
     from tests.mock_server import app
 
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error")
-
-
-def wait_for_server(url, timeout=10):
-    """Wait for the server to be ready."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            with httpx.Client() as client:
-                response = client.get(f"{url}/health", timeout=1.0)
-                if response.status_code == 200:
-                    return True
-        except (httpx.ConnectError, httpx.TimeoutException):
-            time.sleep(0.1)
-    return False
+    uvicorn.Server(uvicorn.Config(app, log_level="error")).run(sockets=[sock])
 
 
 @pytest.fixture(scope="session")
 def mock_server():
-    """Start mock server for testing and return its URL."""
-    port = 8000  # Use the default port expected by tests
+    """Start mock server for tests that need a real socket (e.g. WebSockets)."""
+    # Bind before starting the server so the port can't be taken in between;
+    # connections made before the server is up wait in the listen backlog
+    sock = bind_free_socket()
+    url = f"http://127.0.0.1:{sock.getsockname()[1]}"
 
     # Start server in a separate process
-    server_process = multiprocessing.Process(target=run_mock_server, args=(port,))
+    server_process = multiprocessing.Process(target=run_mock_server, args=(sock,))
     server_process.start()
 
-    # Wait for server to be ready
-    url = f"http://127.0.0.1:{port}"
-    if not wait_for_server(url, timeout=10):
+    try:
+        # Single request; it is answered as soon as the server starts accepting
+        httpx.get(f"{url}/health", timeout=10.0).raise_for_status()
+    except httpx.HTTPError:
         server_process.terminate()
         server_process.join(timeout=5)
+        sock.close()
         pytest.fail("Mock server failed to start")
 
     yield url
@@ -63,6 +53,7 @@ def mock_server():
     if server_process.is_alive():
         server_process.kill()
         server_process.join()
+    sock.close()
 
 
 @pytest.fixture
@@ -71,7 +62,23 @@ def mock_server_url(mock_server):
     return mock_server
 
 
+def _mock_app_client():
+    """Create HTTP client that calls the mock app in-process (no server needed)."""
+    from fastapi.testclient import TestClient
+    from tests.mock_server import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """HTTP client shared by the whole test session."""
+    with _mock_app_client() as c:
+        yield c
+
+
 @pytest.fixture
-def client(mock_server_url):
-    """Create HTTP client for testing."""
-    return httpx.Client(base_url=mock_server_url, timeout=5.0)
+def fresh_client():
+    """Per-test HTTP client for tests that change client state (headers, cookies)."""
+    with _mock_app_client() as c:
+        yield c
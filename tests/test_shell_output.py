@@ -0,0 +1,225 @@
+"""Tests for the shell's batched output queue.
+
+ArtNetShell._write_output queues text and flushes it to the output buffer
+after a short delay. These tests drive the real queue methods on a stub
+shell, using a manually advanced clock so flush timing is deterministic.
+"""
+
+import asyncio
+
+import pytest
+
+from dmx_lan_console.shell.core import (
+    OUTPUT_FLUSH_DELAY,
+    OUTPUT_FLUSH_DELAY_REPAINT,
+    OUTPUT_FLUSH_MAX_DELAY,
+    ArtNetShell,
+)
+from dmx_lan_console.shell.ui_components import OutputBuffer
+
+
+class _Timer:
+    """Timer handle returned by _ManualLoop.call_at."""
+
+    def __init__(self, when, callback):
+        self._when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def when(self):
+        return self._when
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _ManualLoop:
+    """Event loop stand-in whose clock only moves when advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.timers = []
+
+    def time(self):
+        return self.now
+
+    def call_at(self, when, callback):
+        timer = _Timer(when, callback)
+        self.timers.append(timer)
+        return timer
+
+    def pending(self):
+        return [t for t in self.timers if not t.cancelled]
+
+    def advance(self, seconds):
+        """Move the clock forward and run every timer that is now due."""
+        self.now += seconds
+        due = sorted((t for t in self.pending() if t.when() <= self.now), key=_Timer.when)
+        for timer in due:
+            self.timers.remove(timer)
+            timer.callback()
+
+
+class _StubApp:
+    """Just enough of a prompt_toolkit Application for the output queue."""
+
+    def __init__(self, loop, is_running=True):
+        self.loop = loop
+        self.is_running = is_running
+        self.invalidations = 0
+
+    def invalidate(self):
+        self.invalidations += 1
+
+
+def _make_shell(loop, is_running=True):
+    """Build an ArtNetShell with only the output queue state initialized."""
+    shell = ArtNetShell.__new__(ArtNetShell)
+    shell.app = _StubApp(loop, is_running)
+    shell.output_buffer = OutputBuffer()
+    shell.follow_tail = True
+    shell._pending_output = []
+    shell._output_flush_handle = None
+    shell._output_flush_deadline = 0.0
+    return shell
+
+
+@pytest.fixture
+def loop():
+    return _ManualLoop()
+
+
+def test_write_is_flushed_after_delay(loop):
+    """Test that queued text reaches the buffer only after OUTPUT_FLUSH_DELAY."""
+    shell = _make_shell(loop)
+    shell._write_output("one\n")
+
+    assert shell.output_buffer.text == ""
+    assert loop.pending()[0].when() == pytest.approx(loop.now + OUTPUT_FLUSH_DELAY)
+
+    loop.advance(OUTPUT_FLUSH_DELAY / 2)
+    assert shell.output_buffer.text == ""
+
+    loop.advance(OUTPUT_FLUSH_DELAY)
+    assert shell.output_buffer.text == "one\n"
+    assert shell.app.invalidations == 1
+
+
+def test_writes_are_batched_in_order(loop):
+    """Test that writes queued together are flushed once, in order."""
+    shell = _make_shell(loop)
+    shell._write_output("a\n")
+    shell._write_output("b\n")
+    shell._write_output("c\n")
+
+    assert len(loop.pending()) == 1
+
+    loop.advance(OUTPUT_FLUSH_DELAY)
+    assert shell.output_buffer.text == "a\nb\nc\n"
+    assert shell.app.invalidations == 1
+
+
+def test_repaint_write_uses_longer_delay(loop):
+    """Test that text that clears or homes the screen waits for a full frame."""
+    shell = _make_shell(loop)
+    shell._write_output("\x1b[2J\x1b[Hframe\n")
+
+    assert loop.pending()[0].when() == pytest.approx(loop.now + OUTPUT_FLUSH_DELAY_REPAINT)
+
+
+def test_earlier_write_keeps_scheduled_flush(loop):
+    """Test that a write needing an earlier flush does not reschedule."""
+    shell = _make_shell(loop)
+    shell._write_output("\x1b[Hframe\n")
+    first = shell._output_flush_handle
+
+    loop.advance(OUTPUT_FLUSH_DELAY / 2)
+    shell._write_output("line\n")
+
+    assert shell._output_flush_handle is first
+    assert not first.cancelled
+
+
+def test_later_write_reschedules_flush(loop):
+    """Test that a write needing a later flush replaces the scheduled one."""
+    shell = _make_shell(loop)
+    shell._write_output("line\n")
+    first = shell._output_flush_handle
+
+    shell._write_output("\x1b[Hframe\n")
+
+    assert first.cancelled
+    assert shell._output_flush_handle.when() == pytest.approx(loop.now + OUTPUT_FLUSH_DELAY_REPAINT)
+
+
+def test_steady_stream_is_flushed_by_deadline(loop):
+    """Test that a steady stream of writes is flushed no later than OUTPUT_FLUSH_MAX_DELAY."""
+    shell = _make_shell(loop)
+    start = loop.now
+    step = OUTPUT_FLUSH_DELAY_REPAINT / 4
+
+    # Each write would push the flush OUTPUT_FLUSH_DELAY_REPAINT further out
+    for _ in range(20):
+        shell._write_output("\x1b[Hframe\n")
+        loop.advance(step)
+        if shell.output_buffer.text:
+            break
+
+    assert OUTPUT_FLUSH_MAX_DELAY <= loop.now - start + 1e-9
+    assert loop.now - start <= OUTPUT_FLUSH_MAX_DELAY + step
+    assert shell.app.invalidations == 1
+
+    # The next write starts a new batch with a fresh deadline
+    shell._write_output("next\n")
+    assert shell._output_flush_deadline == pytest.approx(loop.now + OUTPUT_FLUSH_MAX_DELAY)
+
+
+def test_write_before_app_runs_is_immediate(loop):
+    """Test that text is written at once while the application is not running."""
+    shell = _make_shell(loop, is_running=False)
+    shell._write_output("startup\n")
+
+    assert shell.output_buffer.text == "startup\n"
+    assert loop.pending() == []
+
+
+def test_clear_drops_pending_output(loop):
+    """Test that clearing the output cancels text that has not been flushed."""
+    shell = _make_shell(loop)
+    shell._write_output("old\n")
+    loop.advance(OUTPUT_FLUSH_DELAY)
+    shell._write_output("queued\n")
+
+    shell._clear_output()
+
+    assert shell.output_buffer.text == ""
+    assert loop.pending() == []
+
+    loop.advance(OUTPUT_FLUSH_MAX_DELAY)
+    assert shell.output_buffer.text == ""
+
+
+def test_explicit_flush_writes_pending_output(loop):
+    """Test that _flush_output writes queued text and cancels the timer."""
+    shell = _make_shell(loop)
+    shell._write_output("now\n")
+    timer = shell._output_flush_handle
+
+    shell._flush_output()
+
+    assert shell.output_buffer.text == "now\n"
+    assert timer.cancelled
+    assert shell._output_flush_handle is None
+
+
+async def test_flush_on_running_event_loop():
+    """Test that queued text is flushed by the running asyncio loop."""
+    shell = _make_shell(asyncio.get_running_loop())
+    shell._write_output("first\n")
+    shell._write_output("second\n")
+
+    assert shell.output_buffer.text == ""
+    await asyncio.sleep(OUTPUT_FLUSH_MAX_DELAY * 2)
+
+    assert shell.output_buffer.text == "first\nsecond\n"
+    assert shell.app.invalidations == 1